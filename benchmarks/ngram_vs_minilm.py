@@ -0,0 +1,138 @@
+"""
+Compare the n-gram and MiniLM embedding backends on the sample data.
+
+Runs the same read -> prepare -> exact diff -> fuzzy pipeline as the CLI, then
+feeds the fuzzy mismatches through `semantic_mismatch_filter` with each
+backend. Reports embedding throughput and where the kept/similar decisions
+agree or differ.
+
+Usage:
+  python -m benchmarks.ngram_vs_minilm --data-dir data_example
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import polars as pl
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from bilingual_merge.diffing import find_exact_differences
+from bilingual_merge.embeddings import Embedder, MiniLMEmbedder, NgramEmbedder
+from bilingual_merge.fuzzy import fuzzy_mismatch_filter
+from bilingual_merge.io_utils import read_df
+from bilingual_merge.normalize import prepare
+from bilingual_merge.semantic import semantic_mismatch_filter
+
+console = Console()
+quiet = Console(quiet=True)
+app = typer.Typer(add_completion=False)
+
+
+def time_embed(
+    make: Callable[[], Embedder], texts: List[str], repeat: int
+) -> Tuple[float, float]:
+    """Return (setup seconds, texts/sec) for embedding `texts` `repeat` times."""
+    t0 = time.perf_counter()
+    embedder = make()
+    setup = time.perf_counter() - t0
+
+    embedder.embed(texts)  # warm-up (also fits IDF for the n-gram backend)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        embedder.embed(texts)
+    elapsed = time.perf_counter() - t0
+    return setup, len(texts) * repeat / elapsed
+
+
+def decisions(
+    candidates: pl.DataFrame, tgt: pl.DataFrame, embedder: Embedder, threshold: float
+) -> Dict[str, bool]:
+    """Map candidate EN -> True if kept (semantic mismatch), False if similar."""
+    kept, similar = semantic_mismatch_filter(
+        candidates=candidates,
+        tgt=tgt,
+        embedder=embedder,
+        threshold=threshold,
+        max_candidates_per_row=tgt.height,
+        console=quiet,
+    )
+    out = {en: True for en in kept["en"].to_list()}
+    if not similar.is_empty():
+        out.update({en: False for en in similar["en"].to_list()})
+    return out
+
+
+@app.command()
+def main(
+    data_dir: Path = typer.Option(Path("data_example"), help="Sample data folder."),
+    fuzzy_threshold: int = typer.Option(92, help="Fuzzy threshold."),
+    minilm_threshold: float = typer.Option(0.82, help="MiniLM cosine threshold."),
+    ngram_threshold: float = typer.Option(0.5, help="N-gram cosine threshold."),
+    minilm_model: str = typer.Option(
+        "sentence-transformers/all-MiniLM-L6-v2", help="MiniLM model id."
+    ),
+    ngram_dim: int = typer.Option(4096, help="N-gram hash buckets."),
+    repeat: int = typer.Option(20, help="Embedding passes for throughput timing."),
+):
+    src = prepare(read_df(data_dir / "source.csv"), "en", "fr")
+    tgt = prepare(read_df(data_dir / "target.csv"), "en", "fr")
+    candidates = find_exact_differences(src, tgt)
+    fuzzy_kept, _ = fuzzy_mismatch_filter(
+        candidates=candidates,
+        tgt=tgt,
+        threshold=fuzzy_threshold,
+        max_candidates_per_row=tgt.height,
+        console=quiet,
+    )
+    if fuzzy_kept.is_empty():
+        console.print("[yellow]No fuzzy mismatches to compare.[/yellow]")
+        raise typer.Exit(code=0)
+
+    texts = tgt["en"].to_list() + fuzzy_kept["en"].to_list()
+    backends = {
+        "ngram": (lambda: NgramEmbedder(dim=ngram_dim), ngram_threshold),
+        "minilm": (lambda: MiniLMEmbedder(minilm_model), minilm_threshold),
+    }
+
+    perf = Table(title=f"Embedding throughput ({len(texts)} texts x {repeat})")
+    perf.add_column("Backend", style="bold")
+    perf.add_column("Setup (s)", justify="right")
+    perf.add_column("Texts/s", justify="right")
+    results: Dict[str, Dict[str, bool]] = {}
+    for name, (make, threshold) in backends.items():
+        setup, rate = time_embed(make, texts, repeat)
+        perf.add_row(name, f"{setup:.3f}", f"{rate:,.0f}")
+        results[name] = decisions(fuzzy_kept, tgt, make(), threshold)
+    console.print(perf)
+
+    ngram, minilm = results["ngram"], results["minilm"]
+    agree = sum(ngram[en] == minilm[en] for en in minilm)
+    summary = Table(title="Semantic decisions on fuzzy mismatches")
+    summary.add_column("Metric", style="bold")
+    summary.add_column("Rows", justify="right")
+    summary.add_row("candidates", f"{len(minilm):,}")
+    summary.add_row("minilm_kept", f"{sum(minilm.values()):,}")
+    summary.add_row("ngram_kept", f"{sum(ngram.values()):,}")
+    summary.add_row("agree", f"{agree:,}")
+    console.print(summary)
+
+    diff = Table(title="Disagreements")
+    diff.add_column("Candidate EN")
+    diff.add_column("MiniLM")
+    diff.add_column("N-gram")
+    for en, kept in minilm.items():
+        if ngram[en] != kept:
+            diff.add_row(
+                en,
+                "kept" if kept else "similar",
+                "kept" if ngram[en] else "similar",
+            )
+    if diff.row_count:
+        console.print(diff)
+
+
+if __name__ == "__main__":
+    app()
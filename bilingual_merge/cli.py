@@ -13,13 +13,19 @@ from bilingual_merge.normalize import prepare
 from bilingual_merge.diffing import find_exact_differences
 from bilingual_merge.fuzzy import fuzzy_mismatch_filter
 from bilingual_merge.semantic import semantic_mismatch_filter
+from bilingual_merge.pipeline import EmbeddingPrefetch
 from bilingual_merge.output import (
     append_and_dedupe_target,
     write_jsonl,
     write_csv,
     write_similar_items,
 )
-from bilingual_merge.embeddings import MiniLMEmbedder, GeminiEmbedder, Embedder
+from bilingual_merge.embeddings import (
+    MiniLMEmbedder,
+    GeminiEmbedder,
+    NgramEmbedder,
+    Embedder,
+)
 
 console = Console()
 app = typer.Typer(add_completion=False)
@@ -34,6 +40,14 @@ def render_summary(title: str, counts: Dict[str, int]) -> None:
     console.print(table)
 
 
+def build_embedder(cfg: Config) -> Embedder:
+    if cfg.embed_backend == "minilm":
+        return MiniLMEmbedder(cfg.minilm_model)
+    if cfg.embed_backend == "ngram":
+        return NgramEmbedder(dim=cfg.ngram_dim)
+    return GeminiEmbedder(model=cfg.gemini_model, api_key=cfg.gemini_api_key)
+
+
 @app.command()
 def main(
     source: Path = typer.Option(
@@ -51,7 +65,7 @@ def main(
     semantic_threshold: float = typer.Option(
         0.82, help="Keep rows whose best cosine similarity is < this."
     ),
-    embed_backend: Literal["minilm", "gemini"] = typer.Option(
+    embed_backend: Literal["minilm", "gemini", "ngram"] = typer.Option(
         "minilm", help="Embedding backend."
     ),
     minilm_model: str = typer.Option(
@@ -63,9 +77,16 @@ def main(
     gemini_api_key: Optional[str] = typer.Option(
         None, help="Gemini API key (or set GEMINI_API_KEY)."
     ),
+    ngram_dim: int = typer.Option(
+        4096, help="Hash buckets for the n-gram embedding backend."
+    ),
     max_candidates_per_row: int = typer.Option(
         200, help="Speed cap for scanning target rows per candidate."
     ),
+    pipelined: bool = typer.Option(
+        False,
+        help="Prepare embedder and target embeddings in the background during fuzzy.",
+    ),
 ):
     logger.remove()
     logger.add(lambda msg: console.print(msg, end=""), level="INFO")
@@ -82,7 +103,9 @@ def main(
         minilm_model=minilm_model,
         gemini_model=gemini_model,
         gemini_api_key=gemini_api_key,
+        ngram_dim=ngram_dim,
         max_candidates_per_row=max_candidates_per_row,
+        pipelined=pipelined,
     )
 
     # Read
@@ -109,14 +132,30 @@ def main(
         console.print(f"[cyan]Output:[/cyan] {cfg.out}")
         raise typer.Exit(code=0)
 
-    # Fuzzy mismatch filter
-    fuzzy_kept, fuzzy_similar = fuzzy_mismatch_filter(
-        candidates=candidates,
-        tgt=tgt,
-        threshold=cfg.fuzzy_threshold,
-        max_candidates_per_row=min(cfg.max_candidates_per_row, tgt.height),
-        console=console,
+    # Embedder + target embeddings in the background while fuzzy runs
+    prefetch = (
+        EmbeddingPrefetch(
+            lambda: build_embedder(cfg),
+            tgt,
+            max_candidates_per_row=min(cfg.max_candidates_per_row, tgt.height),
+        )
+        if cfg.pipelined
+        else None
     )
+
+    # Fuzzy mismatch filter
+    try:
+        fuzzy_kept, fuzzy_similar = fuzzy_mismatch_filter(
+            candidates=candidates,
+            tgt=tgt,
+            threshold=cfg.fuzzy_threshold,
+            max_candidates_per_row=min(cfg.max_candidates_per_row, tgt.height),
+            console=console,
+        )
+    except BaseException:
+        if prefetch is not None:
+            prefetch.cancel()
+        raise
     render_summary(
         "After fuzzy filter",
         {
@@ -127,6 +166,8 @@ def main(
     )
 
     if fuzzy_kept.is_empty():
+        if prefetch is not None:
+            prefetch.cancel()
         console.print(
             "[yellow]All candidates had strong fuzzy matches. Writing target as JSONL.[/yellow]"
         )
@@ -136,10 +177,12 @@ def main(
         raise typer.Exit(code=0)
 
     # Embedding backend
-    if cfg.embed_backend == "minilm":
-        embedder: Embedder = MiniLMEmbedder(cfg.minilm_model)
+    tgt_emb = None
+    if prefetch is not None:
+        with console.status("Waiting for embedder and target EN embeddings..."):
+            embedder, tgt_emb = prefetch.result()
     else:
-        embedder = GeminiEmbedder(model=cfg.gemini_model, api_key=cfg.gemini_api_key)
+        embedder = build_embedder(cfg)
 
     # Semantic mismatch filter
     semantic_kept, semantic_similar = semantic_mismatch_filter(
@@ -149,6 +192,7 @@ def main(
         threshold=cfg.semantic_threshold,
         max_candidates_per_row=min(cfg.max_candidates_per_row, tgt.height),
         console=console,
+        tgt_emb=tgt_emb,
     )
     render_summary(
         "After semantic filter",
@@ -12,8 +12,10 @@ class Config:
     fr_col: str
     fuzzy_threshold: int
     semantic_threshold: float
-    embed_backend: Literal["minilm", "gemini"]
+    embed_backend: Literal["minilm", "gemini", "ngram"]
     minilm_model: str
     gemini_model: str
     gemini_api_key: Optional[str]
+    ngram_dim: int
     max_candidates_per_row: int
+    pipelined: bool = False
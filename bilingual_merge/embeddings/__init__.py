@@ -1,5 +1,6 @@
 from .base import Embedder
 from .minilm import MiniLMEmbedder
 from .gemini import GeminiEmbedder
+from .ngram import NgramEmbedder
 
-__all__ = ["Embedder", "MiniLMEmbedder", "GeminiEmbedder"]
+__all__ = ["Embedder", "MiniLMEmbedder", "GeminiEmbedder", "NgramEmbedder"]
@@ -0,0 +1,130 @@
+import re
+import zlib
+from typing import List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .base import Embedder
+
+_WORD_RE = re.compile(r"\w+")
+_WS_RE = re.compile(r"\s+")
+
+_PRIME = np.uint64(0x100000001B3)
+_MIX_1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX_2 = np.uint64(0xC4CEB9FE1A85EC53)
+_SHIFT = np.uint64(33)
+
+# Distinct seeds so char and word n-grams of the same order land in different buckets.
+_CHAR_SEED = 0x9E3779B97F4A7C15
+_WORD_SEED = 0x632BE59BD9B4E019
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """Finalize 64-bit hashes (murmur3 fmix64) so low bits are well spread."""
+    h = h ^ (h >> _SHIFT)
+    h = h * _MIX_1
+    h = h ^ (h >> _SHIFT)
+    h = h * _MIX_2
+    return h ^ (h >> _SHIFT)
+
+
+def _ngram_hashes(
+    codes: np.ndarray, ngram_range: Tuple[int, int], seed: int
+) -> np.ndarray:
+    """Rolling polynomial hash of every n-gram of `codes` for n in ngram_range."""
+    lo, hi = ngram_range
+    parts: List[np.ndarray] = []
+    for n in range(lo, hi + 1):
+        m = codes.size - n + 1
+        if m <= 0:
+            break
+        h = np.full(m, np.uint64((seed + n) & 0xFFFFFFFFFFFFFFFF), dtype=np.uint64)
+        for k in range(n):
+            h = h * _PRIME + codes[k : k + m]
+        parts.append(h)
+    if not parts:
+        return np.empty(0, dtype=np.uint64)
+    return _mix(np.concatenate(parts))
+
+
+class NgramEmbedder(Embedder):
+    """
+    Model-free embeddings from hashed character and word n-grams.
+
+    Each text is lowercased, its character and word n-grams are hashed into
+    `dim` buckets, counts are weighted with sublinear TF-IDF and rows are
+    L2-normalized, so dot products are cosine similarities. Needs only NumPy:
+    no model download, and cheap enough to embed large batches quickly.
+
+    IDF weights come from `fit()`; if `embed()` is called before fitting, the
+    first batch it sees is used. `semantic_mismatch_filter` embeds the target
+    texts first, so by default the IDF reflects the target corpus.
+    """
+
+    def __init__(
+        self,
+        dim: int = 4096,
+        char_ngram_range: Tuple[int, int] = (3, 5),
+        word_ngram_range: Tuple[int, int] = (1, 2),
+    ):
+        if dim <= 0:
+            raise ValueError(f"dim must be positive, got {dim}")
+        logger.info(
+            f"Initializing n-gram embedder dim={dim} "
+            f"char={char_ngram_range} word={word_ngram_range}"
+        )
+        self.dim = dim
+        self.char_ngram_range = char_ngram_range
+        self.word_ngram_range = word_ngram_range
+        self.idf: Optional[np.ndarray] = None
+
+    def _buckets(self, text: str) -> np.ndarray:
+        text = _WS_RE.sub(" ", text.lower()).strip()
+        chars = np.frombuffer(f" {text} ".encode("utf-32-le"), dtype=np.uint32)
+        words = np.fromiter(
+            (zlib.crc32(w.encode("utf-8")) for w in _WORD_RE.findall(text)),
+            dtype=np.uint32,
+        )
+        h = np.concatenate(
+            [
+                _ngram_hashes(
+                    chars.astype(np.uint64), self.char_ngram_range, _CHAR_SEED
+                ),
+                _ngram_hashes(
+                    words.astype(np.uint64), self.word_ngram_range, _WORD_SEED
+                ),
+            ]
+        )
+        return (h % np.uint64(self.dim)).astype(np.int64)
+
+    def _counts(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sparse (row, col, count) triplets of bucket counts per text."""
+        buckets = [self._buckets(t) for t in texts]
+        rows = np.repeat(
+            np.arange(len(texts), dtype=np.int64), [b.size for b in buckets]
+        )
+        cols = np.concatenate(buckets) if buckets else np.empty(0, dtype=np.int64)
+        keys, counts = np.unique(rows * self.dim + cols, return_counts=True)
+        return keys // self.dim, keys % self.dim, counts
+
+    def fit(self, texts: List[str]) -> "NgramEmbedder":
+        """Compute smoothed IDF weights over `texts`."""
+        _, cols, _ = self._counts(texts)
+        df = np.bincount(cols, minlength=self.dim).astype(np.float32)
+        n = np.float32(len(texts))
+        self.idf = np.log((1.0 + n) / (1.0 + df)).astype(np.float32) + 1.0
+        return self
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        if self.idf is None:
+            self.fit(texts)
+        assert self.idf is not None
+
+        rows, cols, counts = self._counts(texts)
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        out[rows, cols] = (1.0 + np.log(counts)) * self.idf[cols]
+
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
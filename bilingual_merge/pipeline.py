@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import polars as pl
+from loguru import logger
+
+from bilingual_merge.embeddings.base import Embedder
+from bilingual_merge.semantic import target_texts
+
+
+class EmbeddingPrefetch:
+    """
+    Build the embedder and embed target EN on a background thread.
+
+    Neither depends on the fuzzy results, so model load (or API client setup) and
+    target embedding can overlap with fuzzy scoring. Call result() to get
+    (embedder, tgt_emb) for semantic_mismatch_filter, or cancel() when the fuzzy
+    stage leaves no candidates.
+
+    A job that has not started is dropped on cancel(). One that is already
+    loading the model cannot be interrupted, but it skips the target embedding
+    and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        make_embedder: Callable[[], Embedder],
+        tgt: pl.DataFrame,
+        *,
+        max_candidates_per_row: int,
+    ):
+        self._cancelled = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embed-prefetch"
+        )
+        self._future: Future[Tuple[Embedder, Optional[np.ndarray]]] = (
+            self._executor.submit(self._run, make_embedder, tgt, max_candidates_per_row)
+        )
+        # Single job: let the worker exit as soon as it is done.
+        self._executor.shutdown(wait=False)
+
+    def _run(
+        self,
+        make_embedder: Callable[[], Embedder],
+        tgt: pl.DataFrame,
+        max_candidates_per_row: int,
+    ) -> Tuple[Embedder, Optional[np.ndarray]]:
+        embedder = make_embedder()
+        if self._cancelled.is_set() or tgt.is_empty():
+            return embedder, None
+
+        tgt_en = target_texts(tgt, max_candidates_per_row)
+        logger.info(f"Embedding target EN in background: {len(tgt_en)} rows")
+        return embedder, embedder.embed(tgt_en)  # (M, D)
+
+    def result(self) -> Tuple[Embedder, Optional[np.ndarray]]:
+        """Block until ready. Re-raises any error from the background job."""
+        if self._cancelled.is_set():
+            raise RuntimeError("Embedding prefetch was cancelled.")
+        return self._future.result()
+
+    def cancel(self) -> None:
+        """Stop the background job if possible. Safe to call more than once."""
+        if self._cancelled.is_set() or self._future.done():
+            return
+        logger.info("Cancelling embedding prefetch")
+        self._cancelled.set()
+        self._future.cancel()
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import polars as pl
@@ -15,6 +15,16 @@ from rich.progress import (
 from bilingual_merge.embeddings.base import Embedder
 
 
+def target_texts(tgt: pl.DataFrame, max_candidates_per_row: int) -> List[str]:
+    """Target EN strings scanned per candidate, capped at max_candidates_per_row."""
+    tgt_en_all = tgt["en"].to_list()
+    return (
+        tgt_en_all[:max_candidates_per_row]
+        if max_candidates_per_row < len(tgt_en_all)
+        else tgt_en_all
+    )
+
+
 def semantic_mismatch_filter(
     candidates: pl.DataFrame,
     tgt: pl.DataFrame,
@@ -23,28 +33,28 @@ def semantic_mismatch_filter(
     *,
     max_candidates_per_row: int,
     console: Console,
+    tgt_emb: Optional[np.ndarray] = None,
 ) -> Tuple[pl.DataFrame, pl.DataFrame]:
     """
     Embed candidate EN and target EN. For each candidate compute best cosine similarity
     against target EN. Keep candidates whose best_sim < threshold.
     Returns (kept, similar) where similar are rows filtered out (similarity >= threshold).
 
+    tgt_emb may carry target EN embeddings computed ahead of time (see pipeline.py);
+    they must come from the same embedder and target_texts(tgt, max_candidates_per_row).
+
     Assumes embedder outputs normalized vectors (or we treat dot product as cosine).
     """
-    tgt_en_all = tgt["en"].to_list()
-    if not tgt_en_all:
+    if tgt.is_empty():
         return candidates, pl.DataFrame()
 
-    tgt_en = (
-        tgt_en_all[:max_candidates_per_row]
-        if max_candidates_per_row < len(tgt_en_all)
-        else tgt_en_all
-    )
     cand_en = candidates["en"].to_list()
 
-    logger.info(f"Embedding target EN: {len(tgt_en)} rows")
-    with console.status("Embedding target EN..."):
-        tgt_emb = embedder.embed(tgt_en)  # (M, D)
+    if tgt_emb is None:
+        tgt_en = target_texts(tgt, max_candidates_per_row)
+        logger.info(f"Embedding target EN: {len(tgt_en)} rows")
+        with console.status("Embedding target EN..."):
+            tgt_emb = embedder.embed(tgt_en)  # (M, D)
 
     logger.info(f"Embedding candidate EN: {len(cand_en)} rows")
     with console.status("Embedding candidate EN..."):